@@ -16,6 +16,7 @@
 
 import abc
 import itertools
+import os
 import re
 from logging import Logger
 from typing import Optional, List, Any, Dict, Tuple, Union, Pattern
@@ -89,6 +90,28 @@ class BaseBackend(abc.ABC):
         self._preserve_punctuation = preserve_punctuation
         self._punctuator = Punctuation(punctuation_marks)
 
+    @staticmethod
+    def _init_cache_size() -> int:
+        """Returns the cache size as specified by PHONEMIZER_CACHE_SIZE
+
+        Default to 10000 utterances, 0 disables the cache.
+
+        Raises
+        ------
+        RuntimeError if PHONEMIZER_CACHE_SIZE is not a positive integer or 0
+
+        """
+        size = os.environ.get('PHONEMIZER_CACHE_SIZE', '10000')
+        try:
+            size = int(size)
+            if size < 0:
+                raise ValueError
+        except ValueError:
+            raise RuntimeError(
+                f'PHONEMIZER_CACHE_SIZE={size} '
+                f'must be a positive integer or 0') from None
+        return size
+
     @classmethod
     def _init_language(cls, language):
         """Language initialization
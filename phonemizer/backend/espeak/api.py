@@ -23,7 +23,7 @@ import tempfile
 import weakref
 from ctypes import CDLL
 from pathlib import Path
-from typing import Union
+from typing import Dict, List, Tuple, Union
 
 from phonemizer.backend.espeak.voice import EspeakVoice
 
@@ -40,6 +40,16 @@ class EspeakAPI:
 
     """
 
+    # A pool of espeak library copies already loaded, indexed by the path of
+    # the original library. When an instance is destroyed, its library copy is
+    # released in the pool and recycled by the next instance, saving a copy of
+    # the library on disk and a call to dlopen.
+    _LIBRARY_POOL: Dict[Path, List[Tuple[CDLL, str]]] = {}
+
+    # set to True at exit, the library copies are then deleted instead of
+    # being released to the pool
+    _LIBRARY_POOL_CLOSED = False
+
     def __init__(self, library: Union[str, Path]):
         # set to None to avoid an AttributeError in _delete if the __init__
         # method raises, will be properly initialized below
@@ -62,8 +72,33 @@ class EspeakAPI:
             raise RuntimeError(
                 f'failed to load espeak library: {str(error)}') from None
 
-        # will be automatically destroyed after use
-        self._tempdir = tempfile.mkdtemp()
+        # recycle a copy of the library released by a previous instance, or
+        # make a new one
+        try:
+            self._library, self._tempdir = (
+                self._LIBRARY_POOL[library_path].pop())
+        except (KeyError, IndexError):
+            self._library, self._tempdir = self._copy_library(library_path)
+
+        # initialize the library copy. 0x02 is AUDIO_OUTPUT_SYNCHRONOUS in the
+        # espeak API. On failure the copy is deleted, it must not be released
+        # to the pool.
+        try:
+            status = self._library.espeak_Initialize(0x02, 0, None, 0)
+        except AttributeError:  # pragma: nocover
+            self._delete(self._library, self._tempdir)
+            raise RuntimeError(
+                'failed to load espeak library') from None
+        if status <= 0:  # pragma: nocover
+            self._delete(self._library, self._tempdir)
+            raise RuntimeError(
+                'failed to initialize espeak shared library')
+
+        # Once used for mbrola synthesis, a library copy holds global state
+        # (mbrola voice, phoneme trace file) that espeak_Terminate may not
+        # reset, so it is deleted instead of being recycled. See
+        # set_voice_by_name() and set_phoneme_trace().
+        self._recyclable = {'value': True}
 
         # properly exit when the wrapper object is destroyed (see
         # https://docs.python.org/3/library/weakref.html#comparing-finalizers-with-del-methods).
@@ -74,31 +109,106 @@ class EspeakAPI:
         if sys.platform == 'win32':  # pragma: nocover
             atexit.register(self._delete_win32)
         else:
-            weakref.finalize(self, self._delete, self._library, self._tempdir)
+            weakref.finalize(
+                self, self._release, library_path, self._library,
+                self._tempdir, self._recyclable)
 
-        espeak_copy = pathlib.Path(self._tempdir) / library_path.name
-        shutil.copy(library_path, espeak_copy, follow_symlinks=False)
-
-        # finally load the library copy and initialize it. 0x02 is
-        # AUDIO_OUTPUT_SYNCHRONOUS in the espeak API
-        self._library = ctypes.cdll.LoadLibrary(str(espeak_copy))
-        try:
-            if self._library.espeak_Initialize(0x02, 0, None, 0) <= 0:
-                raise RuntimeError(  # pragma: nocover
-                    'failed to initialize espeak shared library')
-        except AttributeError:  # pragma: nocover
-            raise RuntimeError(
-                'failed to load espeak library') from None
+        # setup the prototypes of the espeak functions once for all
+        self._init_functions()
 
         # the path to the original one (the copy is considered an
         # implementation detail and is not exposed)
         self._library_path = library_path
 
+    def _init_functions(self):
+        """Retrieves the espeak functions and declares their prototypes"""
+        self._f_info = self._library.espeak_Info
+        self._f_info.restype = ctypes.c_char_p
+
+        self._f_list_voices = self._library.espeak_ListVoices
+        self._f_list_voices.argtypes = [
+            ctypes.POINTER(EspeakVoice.VoiceStruct)]
+        self._f_list_voices.restype = ctypes.POINTER(
+            ctypes.POINTER(EspeakVoice.VoiceStruct))
+
+        self._f_set_voice_by_name = self._library.espeak_SetVoiceByName
+        self._f_set_voice_by_name.argtypes = [ctypes.c_char_p]
+
+        self._f_get_current_voice = self._library.espeak_GetCurrentVoice
+        self._f_get_current_voice.restype = ctypes.POINTER(
+            EspeakVoice.VoiceStruct)
+
+        self._f_text_to_phonemes = self._library.espeak_TextToPhonemes
+        self._f_text_to_phonemes.restype = ctypes.c_char_p
+        self._f_text_to_phonemes.argtypes = [
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.c_int,
+            ctypes.c_int]
+
+        self._f_set_phoneme_trace = self._library.espeak_SetPhonemeTrace
+        self._f_set_phoneme_trace.argtypes = [
+            ctypes.c_int,
+            ctypes.c_void_p]
+
+        self._f_synthetize = self._library.espeak_Synth
+        self._f_synthetize.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_size_t,
+            ctypes.c_uint,
+            ctypes.c_int,  # position_type
+            ctypes.c_uint,
+            ctypes.POINTER(ctypes.c_uint),
+            ctypes.c_void_p]
+
+    @staticmethod
+    def _copy_library(library_path: Path) -> Tuple[CDLL, str]:
+        """Loads a copy of `library_path` made in a temporary directory
+
+        Returns the loaded library copy and the temporary directory containing
+        it.
+
+        """
+        tempdir = tempfile.mkdtemp()
+        try:
+            espeak_copy = pathlib.Path(tempdir) / library_path.name
+            shutil.copy(library_path, espeak_copy, follow_symlinks=False)
+            return ctypes.cdll.LoadLibrary(str(espeak_copy)), tempdir
+        except Exception:  # pragma: nocover
+            shutil.rmtree(tempdir)
+            raise
+
     def _delete_win32(self):  # pragma: nocover
         # Windows does not support static methods with ctypes libraries
         # (library == None) so we use a proxy method...
         self._delete(self._library, self._tempdir)
 
+    @classmethod
+    def _release(cls, library_path, library, tempdir, recyclable):
+        """Releases a library copy to the pool for further recycling
+
+        The copy is deleted instead if it cannot be recycled or if the pool is
+        closed.
+
+        """
+        if cls._LIBRARY_POOL_CLOSED or not recyclable['value']:
+            cls._delete(library, tempdir)
+            return
+
+        # clean up the espeak library allocated memory, it will be initialized
+        # again when recycled
+        library.espeak_Terminate()
+        cls._LIBRARY_POOL.setdefault(library_path, []).append(
+            (library, tempdir))
+
+    @classmethod
+    def _close_pool(cls):
+        """Deletes all the library copies in the pool, called at exit"""
+        cls._LIBRARY_POOL_CLOSED = True
+        for copies in cls._LIBRARY_POOL.values():
+            for _, tempdir in copies:
+                shutil.rmtree(tempdir, ignore_errors=True)
+        cls._LIBRARY_POOL.clear()
+
     @staticmethod
     def _delete(library, tempdir):
         try:
@@ -153,10 +263,8 @@ class EspeakAPI:
             number and data path respectively
 
         """
-        f_info = self._library.espeak_Info
-        f_info.restype = ctypes.c_char_p
         data_path = ctypes.c_char_p()
-        version = f_info(ctypes.byref(data_path))
+        version = self._f_info(ctypes.byref(data_path))
         return version, data_path.value
 
     def list_voices(self, name):
@@ -171,11 +279,7 @@ class EspeakAPI:
         voices: a pointer to EspeakVoice.Struct instances
 
         """
-        f_list_voices = self._library.espeak_ListVoices
-        f_list_voices.argtypes = [ctypes.POINTER(EspeakVoice.VoiceStruct)]
-        f_list_voices.restype = ctypes.POINTER(
-            ctypes.POINTER(EspeakVoice.VoiceStruct))
-        return f_list_voices(name)
+        return self._f_list_voices(name)
 
     def set_voice_by_name(self, name) -> int:
         """Bindings to espeak_SetVoiceByName
@@ -189,9 +293,10 @@ class EspeakAPI:
         0 on success, non-zero integer on failure
 
         """
-        f_set_voice_by_name = self._library.espeak_SetVoiceByName
-        f_set_voice_by_name.argtypes = [ctypes.c_char_p]
-        return f_set_voice_by_name(name)
+        if name.startswith(b'mb'):
+            # mbrola voice, see __init__
+            self._recyclable['value'] = False
+        return self._f_set_voice_by_name(name)
 
     def get_current_voice(self):
         """Bindings to espeak_GetCurrentVoice
@@ -201,9 +306,7 @@ class EspeakAPI:
         a EspeakVoice.Struct instance or None if no voice has been setup
 
         """
-        f_get_current_voice = self._library.espeak_GetCurrentVoice
-        f_get_current_voice.restype = ctypes.POINTER(EspeakVoice.VoiceStruct)
-        return f_get_current_voice().contents
+        return self._f_get_current_voice().contents
 
     def text_to_phonemes(self, text_ptr, text_mode, phonemes_mode):
         """Bindings to espeak_TextToPhonemes
@@ -220,13 +323,7 @@ class EspeakAPI:
         an encoded string containing the computed phonemes
 
         """
-        f_text_to_phonemes = self._library.espeak_TextToPhonemes
-        f_text_to_phonemes.restype = ctypes.c_char_p
-        f_text_to_phonemes.argtypes = [
-            ctypes.POINTER(ctypes.c_char_p),
-            ctypes.c_int,
-            ctypes.c_int]
-        return f_text_to_phonemes(text_ptr, text_mode, phonemes_mode)
+        return self._f_text_to_phonemes(text_ptr, text_mode, phonemes_mode)
 
     def set_phoneme_trace(self, mode, file_pointer):
         """"Bindings on espeak_SetPhonemeTrace
@@ -240,11 +337,9 @@ class EspeakAPI:
             the phoneme trace
 
         """
-        f_set_phoneme_trace = self._library.espeak_SetPhonemeTrace
-        f_set_phoneme_trace.argtypes = [
-            ctypes.c_int,
-            ctypes.c_void_p]
-        f_set_phoneme_trace(mode, file_pointer)
+        # the trace file is kept by espeak, see __init__
+        self._recyclable['value'] = False
+        self._f_set_phoneme_trace(mode, file_pointer)
 
     def synthetize(self, text_ptr, size, mode):
         """Bindings on espeak_Synth
@@ -263,13 +358,8 @@ class EspeakAPI:
         0 on success, non-zero integer on failure
 
         """
-        f_synthetize = self._library.espeak_Synth
-        f_synthetize.argtypes = [
-            ctypes.c_void_p,
-            ctypes.c_size_t,
-            ctypes.c_uint,
-            ctypes.c_int,  # position_type
-            ctypes.c_uint,
-            ctypes.POINTER(ctypes.c_uint),
-            ctypes.c_void_p]
-        return f_synthetize(text_ptr, size, 0, 1, 0, mode, None, None)
+        return self._f_synthetize(text_ptr, size, 0, 1, 0, mode, None, None)
+
+
+# delete the pooled library copies when the Python process exits
+atexit.register(EspeakAPI._close_pool)  # pylint: disable=protected-access
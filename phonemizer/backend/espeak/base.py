@@ -15,6 +15,8 @@
 """Base class of espeak backends for the phonemizer"""
 
 import abc
+import functools
+import os
 from logging import Logger
 from typing import Optional, Union, Pattern
 
@@ -81,10 +83,43 @@ class BaseEspeakBackend(BaseBackend):
         """
         return EspeakWrapper.library()
 
+    @staticmethod
+    def _library_config():
+        """The espeak library as configured by the user
+
+        Used as cache key for the shared espeak wrapper: resolving the library
+        path itself can be expensive (see library()).
+
+        """
+        # pylint: disable=protected-access
+        return (
+            EspeakWrapper._ESPEAK_LIBRARY,
+            os.environ.get('PHONEMIZER_ESPEAK_LIBRARY'))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _wrapper(*library_config) -> EspeakWrapper:
+        # pylint: disable=unused-argument
+        return EspeakWrapper()
+
+    @classmethod
+    def _probe(cls) -> EspeakWrapper:
+        """An espeak wrapper shared by the class methods
+
+        Used to query the library (availability, version, voices) without
+        loading a new copy of it on each call.
+
+        Raises
+        ------
+        RuntimeError if the espeak library cannot be loaded
+
+        """
+        return cls._wrapper(*cls._library_config())
+
     @classmethod
     def is_available(cls) -> bool:
         try:
-            EspeakWrapper()
+            cls._probe()
         except RuntimeError:  # pragma: nocover
             return False
         return True
@@ -105,7 +140,7 @@ class BaseEspeakBackend(BaseBackend):
             version cannot be extracted for some reason.
 
         """
-        return EspeakWrapper().version
+        return cls._probe().version
 
     @abc.abstractmethod
     def _postprocess_line(self, line: str, num: int,
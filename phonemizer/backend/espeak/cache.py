@@ -0,0 +1,187 @@
+# Copyright 2015-2021 Mathieu Bernard
+#
+# This file is part of phonemizer: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# Phonemizer is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with phonemizer. If not, see <http://www.gnu.org/licenses/>.
+"""Persistent cache of espeak outputs for the espeak backend
+
+This module is used in phonemizer.backend.EspeakBackend and should be
+considered private.
+
+The raw espeak outputs are stored in a SQLite database so that they can be
+reused across Python processes, for instance when phonemizing the same corpus
+several times. Outputs are indexed by espeak library, data directory, version,
+voice and tie so that a change in the espeak configuration does not return
+stale outputs.
+
+"""
+
+import sqlite3
+import weakref
+from logging import Logger
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from phonemizer.logger import get_logger
+
+
+class DiskCache:
+    """Stores espeak outputs in a SQLite database
+
+    The cache is optional: if the database cannot be opened, read or written
+    (read-only directory, locked database, full disk, ...) a warning is logged
+    and the cache is disabled, phonemization goes on without it.
+
+    Parameters
+    ----------
+    directory (str or Path) : the directory where the database is stored,
+        created if needed.
+    library (str) : the path to the espeak library in use
+    data_path (str) : the path to the espeak data directory in use
+    version (str) : the espeak version the outputs are computed with
+    voice (str) : the identifier of the espeak voice in use
+    tie (str) : the tie character in use, or '' if no tie
+    logger (logging.Logger) : where to send warnings, use the default
+        phonemizer logger if not specified
+
+    """
+    _FILENAME = 'espeak-cache.sqlite'
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, directory: Union[str, Path],
+                 library: str, data_path: str,
+                 version: str, voice: str, tie: str,
+                 logger: Optional[Logger] = None):
+        self._path = Path(directory) / self._FILENAME
+        self._key = (library, data_path, version, voice, tie)
+        self._logger = logger or get_logger()
+
+        # lazily opened connection to the database, see _database()
+        self._connection: Optional[sqlite3.Connection] = None
+
+        # outputs not yet written to the database, see flush()
+        self._pending: List[Tuple[str, str]] = []
+
+        # set to True after an error, the cache is then no more used
+        self._disabled = False
+
+    @property
+    def path(self) -> Path:
+        """The path to the database file"""
+        return self._path
+
+    @property
+    def disabled(self) -> bool:
+        """True if the cache has been disabled after an error"""
+        return self._disabled
+
+    def __getstate__(self):
+        """For pickling, when phonemizing on multiple jobs"""
+        # a connection cannot be pickled, it is opened again on demand
+        return {
+            'path': self._path,
+            'key': self._key,
+            'logger': self._logger,
+            'disabled': self._disabled}
+
+    def __setstate__(self, state: Dict):
+        """For unpickling, when phonemizing on multiple jobs"""
+        self._path = state['path']
+        self._key = state['key']
+        self._logger = state['logger']
+        self._disabled = state['disabled']
+        self._connection = None
+        self._pending = []
+
+    def close(self):
+        """Closes the connection to the database, if opened"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _disable(self, error: Exception):
+        """Logs a warning on `error` and disables the cache"""
+        self._logger.warning(
+            'disabling espeak cache %s: %s', self._path, error)
+        self._disabled = True
+        self._pending = []
+        try:
+            self.close()
+        except sqlite3.Error:  # pragma: nocover
+            self._connection = None
+
+    def _database(self) -> sqlite3.Connection:
+        """Returns the connection to the database, opened if needed"""
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+
+            # the database may be shared by parallel jobs, the timeout allows
+            # to wait for another job writing its outputs
+            connection = sqlite3.connect(str(self._path), timeout=60)
+            try:
+                connection.execute('PRAGMA journal_mode=WAL')
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS espeak ('
+                    'library TEXT, data_path TEXT, version TEXT, voice TEXT, '
+                    'tie TEXT, line TEXT, phonemes TEXT, PRIMARY KEY '
+                    '(library, data_path, version, voice, tie, line))')
+                connection.commit()
+            except sqlite3.Error:
+                connection.close()
+                raise
+
+            # close the connection when the cache is garbage collected
+            weakref.finalize(self, connection.close)
+            self._connection = connection
+        return self._connection
+
+    def get(self, line: str) -> Optional[str]:
+        """Returns the cached espeak output for `line` or None"""
+        if self._disabled:
+            return None
+
+        try:
+            row = self._database().execute(
+                'SELECT phonemes FROM espeak '
+                'WHERE library=? AND data_path=? AND version=? AND voice=? '
+                'AND tie=? AND line=?',
+                (*self._key, line)).fetchone()
+        except (sqlite3.Error, OSError) as error:
+            self._disable(error)
+            return None
+        return None if row is None else row[0]
+
+    def set(self, line: str, phonemes: str):
+        """Registers the espeak output `phonemes` for `line`
+
+        The output is written to the database on the next call to flush().
+
+        """
+        if not self._disabled:
+            self._pending.append((line, phonemes))
+
+    def flush(self):
+        """Writes the pending outputs to the database"""
+        if self._disabled or not self._pending:
+            return
+
+        try:
+            database = self._database()
+            with database:  # commit the transaction
+                database.executemany(
+                    'INSERT OR REPLACE INTO espeak '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    ((*self._key, line, phonemes)
+                     for line, phonemes in self._pending))
+        except (sqlite3.Error, OSError) as error:
+            self._disable(error)
+        self._pending = []
@@ -14,24 +14,35 @@
 # along with phonemizer. If not, see <http://www.gnu.org/licenses/>.
 """Espeak backend for the phonemizer"""
 
+import collections
 import itertools
+import os
 import re
 from logging import Logger
-from typing import Optional, Tuple, List, Union, Pattern
+from typing import Callable, Dict, Optional, Tuple, List, Union, Pattern
 
 from phonemizer.backend.espeak.base import BaseEspeakBackend
+from phonemizer.backend.espeak.cache import DiskCache
 from phonemizer.backend.espeak.language_switch import (
     get_language_switch_processor, LanguageSwitch, BaseLanguageSwitch)
 from phonemizer.backend.espeak.words_mismatch import (
     get_words_mismatch_processor, WordMismatch, BaseWordsMismatch)
-from phonemizer.backend.espeak.wrapper import EspeakWrapper
 from phonemizer.separator import Separator
 
 
 class EspeakBackend(BaseEspeakBackend):
     """Espeak backend for the phonemizer"""
-    # a regular expression to find phonemes stresses in espeak output
-    _ESPEAK_STRESS_RE = re.compile(r"[ˈˌ'-]+")
+    # a translation table deleting phonemes stresses in espeak output
+    _ESPEAK_STRESS_TABLE = str.maketrans('', '', "ˈˌ'-")
+
+    # a regular expression to collapse any run of whitespaces (including new
+    # lines) in espeak output
+    _ESPEAK_SPACES_RE = re.compile(r'\s+')
+
+    # a regular expression to find extra phone separators in espeak output:
+    # separators at the end of a word and repeated separators, see
+    # _postprocess_line()
+    _ESPEAK_UNDERSCORES_RE = re.compile(r'_+(?= )|(?<=_)_+')
 
     # pylint: disable=too-many-arguments
     def __init__(self, language: str,
@@ -54,6 +65,50 @@ class EspeakBackend(BaseEspeakBackend):
         self._words_mismatch: BaseWordsMismatch = get_words_mismatch_processor(
             words_mismatch, self.logger)
 
+        # word postprocessing functions specialized for a given (phone
+        # separator, strip) pair, see _word_processor()
+        self._word_processors: Dict[Tuple[str, bool], Callable[[str], str]] = {}
+
+        # LRU cache of raw espeak outputs indexed by input utterance, see
+        # _text_to_phonemes()
+        self._cache_size = self._init_cache_size()
+        self._cache: 'collections.OrderedDict[str, str]' = (
+            collections.OrderedDict())
+
+        # persistent cache of raw espeak outputs, enabled by
+        # PHONEMIZER_CACHE_DIR
+        self._disk_cache: Optional[DiskCache] = self._init_disk_cache()
+
+    def __getstate__(self):
+        """For pickling, when phonemizing on multiple jobs"""
+        # the word processors are closures, they are rebuilt on demand. The
+        # cache is not sent to the jobs.
+        state = self.__dict__.copy()
+        state['_word_processors'] = {}
+        state['_cache'] = collections.OrderedDict()
+        return state
+
+    def _init_disk_cache(self) -> Optional[DiskCache]:
+        """Returns a disk cache if PHONEMIZER_CACHE_DIR is defined, else None
+
+        The espeak outputs are stored in the directory PHONEMIZER_CACHE_DIR and
+        reused across Python processes.
+
+        """
+        directory = os.environ.get('PHONEMIZER_CACHE_DIR')
+        if not directory:
+            return None
+
+        self.logger.debug('using espeak cache in %s', directory)
+        return DiskCache(
+            directory,
+            library=str(self._espeak.library_path),
+            data_path=str(self._espeak.data_path),
+            version='.'.join(str(v) for v in self._espeak.version),
+            voice=self._espeak.voice.identifier,
+            tie=self._tie or '',
+            logger=self.logger)
+
     @staticmethod
     def _init_tie(tie) -> Optional[str]:
         if not tie:
@@ -77,7 +132,7 @@ class EspeakBackend(BaseEspeakBackend):
     def supported_languages(cls):
         return {
             voice.language: voice.name
-            for voice in EspeakWrapper().available_voices()}
+            for voice in cls._probe().available_voices()}
 
     def _phonemize_aux(self, text, offset, separator, strip):
         if self._tie is not None and separator.phone:
@@ -87,57 +142,113 @@ class EspeakBackend(BaseEspeakBackend):
 
         output = []
         lang_switches = []
+
+        # bind methods once out of the loop on utterances
+        text_to_phonemes = self._text_to_phonemes
+        postprocess_line = self._postprocess_line
         for num, line in enumerate(text, start=1):
-            line = self._espeak.text_to_phonemes(line, self._tie)
-            line, has_switch = self._postprocess_line(
-                line, num, separator, strip)
+            line, has_switch = postprocess_line(
+                text_to_phonemes(line), num, separator, strip)
             output.append(line)
             if has_switch:
                 lang_switches.append(num + offset)
 
+        if self._disk_cache is not None:
+            self._disk_cache.flush()
+
         return output, lang_switches
 
-    def _process_stress(self, word):
-        if self._with_stress:
-            return word
+    def _text_to_phonemes(self, line: str) -> str:
+        """Returns the raw espeak output for `line`
+
+        The output depends only on `line`, as the voice and tie are fixed for
+        the backend. Recent outputs are cached so that repeated utterances
+        are phonemized only once. If a disk cache is enabled, outputs are also
+        looked up and stored there.
+
+        """
+        cache = self._cache
+        try:
+            phonemes = cache[line]
+            cache.move_to_end(line)
+            return phonemes
+        except KeyError:
+            pass
+
+        phonemes = None
+        if self._disk_cache is not None:
+            phonemes = self._disk_cache.get(line)
+
+        if phonemes is None:
+            phonemes = self._espeak.text_to_phonemes(line, self._tie)
+            if self._disk_cache is not None:
+                self._disk_cache.set(line, phonemes)
+
+        if self._cache_size:
+            cache[line] = phonemes
+            if len(cache) > self._cache_size:
+                # drop the least recently used utterance
+                cache.popitem(last=False)
+        return phonemes
+
+    def _word_processor(self, separator: Separator,
+                        strip: bool) -> Callable[[str], str]:
+        """Returns a function postprocessing a single word of espeak output
+
+        The backend options, `separator` and `strip` are constant during
+        phonemization, so the returned function is specialized once for them
+        and does not branch on each processed word. Stress removal, tie and
+        phone separator replacement are fused in a single translation table.
+
+        """
+        key = (separator.phone, strip)
+        try:
+            return self._word_processors[key]
+        except KeyError:
+            pass
+
         # remove the stresses on phonemes
-        return re.sub(self._ESPEAK_STRESS_RE, '', word)
+        table = {} if self._with_stress else dict(self._ESPEAK_STRESS_TABLE)
 
-    def _process_tie(self, word: str, separator: Separator):
         # NOTE a bug in espeak append ties to (en) flags so as (͡e͡n).
         # We do not correct it here.
         if self._tie is not None and self._tie != '͡':
             # replace default '͡' by the requested one
-            return word.replace('͡', self._tie)
-        return word.replace('_', separator.phone)
+            table[ord('͡')] = self._tie
+        else:
+            table[ord('_')] = separator.phone
+
+        # the phone separator at the end of each word
+        suffix = separator.phone if not strip and self._tie is None else ''
+
+        def process(word):
+            return word.strip().translate(table) + suffix
+
+        self._word_processors[key] = process
+        return process
 
     def _postprocess_line(self, line: str, num: int,
                           separator: Separator, strip: bool) -> Tuple[str, bool]:
         # espeak can split an utterance into several lines because
         # of punctuation, here we merge the lines into a single one
-        line = line.strip().replace('\n', ' ').replace('  ', ' ')
+        line = self._ESPEAK_SPACES_RE.sub(' ', line).strip()
 
         # due to a bug in espeak-ng, some additional separators can be
         # added at the end of a word. Here a quick fix to solve that
         # issue. See https://github.com/espeak-ng/espeak-ng/issues/694
-        line = re.sub(r'_+', '_', line)
-        line = re.sub(r'_ ', ' ', line)
+        line = self._ESPEAK_UNDERSCORES_RE.sub('', line)
 
         line, has_switch = self._lang_switch.process(line)
         if not line:
             return '', has_switch
 
-        out_line = ''
-        for word in line.split(' '):
-            word = self._process_stress(word.strip())
-            if not strip and self._tie is None:
-                word += '_'
-            word = self._process_tie(word, separator)
-            out_line += word + separator.word
+        word_sep = separator.word
+        process_word = self._word_processor(separator, strip)
+        out_line = word_sep.join(map(process_word, line.split(' ')))
 
-        if strip and separator.word:
-            # erase the last word separator from the line
-            out_line = out_line[:-len(separator.word)]
+        if not strip:
+            # append the last word separator to the line
+            out_line += word_sep
 
         return out_line, has_switch
 
@@ -164,9 +275,7 @@ class EspeakBackend(BaseEspeakBackend):
         ['a', 'b', 'c']].
 
         """
-        flattened = []
-        for i in range(len(phonemized[0])):
-            flattened.append(
-                list(itertools.chain(
-                    c for chunk in phonemized for c in chunk[i])))
-        return flattened
+        return [
+            list(itertools.chain.from_iterable(
+                chunk[i] for chunk in phonemized))
+            for i in range(len(phonemized[0]))]
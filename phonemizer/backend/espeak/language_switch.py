@@ -54,16 +54,11 @@ def get_language_switch_processor(mode: LanguageSwitch, logger: Logger, language
     Raises a RuntimeError if the `mode` is unknown.
 
     """
-    processors = {
-        'keep-flags': KeepFlags,
-        'remove-flags': RemoveFlags,
-        'remove-utterance': RemoveUtterances}
-
     try:
-        return processors[mode](logger, language)
+        return _PROCESSORS[mode](logger, language)
     except KeyError:
         raise RuntimeError(
-            f'mode "{mode}" invalid, must be in {", ".join(processors.keys())}'
+            f'mode "{mode}" invalid, must be in {", ".join(_PROCESSORS.keys())}'
         ) from None
 
 
@@ -90,6 +85,9 @@ class BaseLanguageSwitch(abc.ABC):
     @classmethod
     def is_language_switch(cls, utterance: str) -> bool:
         """Returns True is a language switch is present in the `utterance`"""
+        # most utterances have no switch, avoid the regex search on them
+        if '(' not in utterance:
+            return False
         return bool(cls._ESPEAK_FLAGS_RE.search(utterance))
 
     @classmethod
@@ -152,10 +150,13 @@ class RemoveFlags(BaseLanguageSwitch):
 
     @classmethod
     def process(cls, utterance: str) -> Tuple[str, bool]:
-        if cls.is_language_switch(utterance):
-            # remove all the (lang) flags in the current utterance
-            return re.sub(cls._ESPEAK_FLAGS_RE, '', utterance), True
-        return utterance, False
+        if '(' not in utterance:
+            return utterance, False
+
+        # remove all the (lang) flags in the current utterance, detection and
+        # removal are done in a single pass
+        utterance, nflags = cls._ESPEAK_FLAGS_RE.subn('', utterance)
+        return utterance, nflags > 0
 
     def warning(self, switches: List[int]):
         if not switches:
@@ -191,3 +192,10 @@ class RemoveUtterances(BaseLanguageSwitch):
         self._logger.warning(
             'removed %s utterances containing language switches '
             '(applying "remove-utterance" policy)', nswitches)
+
+
+# the language switch processors indexed by mode, built once at import
+_PROCESSORS = {
+    'keep-flags': KeepFlags,
+    'remove-flags': RemoveFlags,
+    'remove-utterance': RemoveUtterances}
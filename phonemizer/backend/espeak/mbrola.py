@@ -14,15 +14,16 @@
 # along with phonemizer. If not, see <http://www.gnu.org/licenses/>.
 """Mbrola backend for the phonemizer"""
 
+import functools
+import os
 import pathlib
 import shutil
 import sys
 from logging import Logger
 from pathlib import Path
-from typing import Union, Optional, List, Dict
+from typing import Union, Optional, List, Dict, Set
 
 from phonemizer.backend.espeak.base import BaseEspeakBackend
-from phonemizer.backend.espeak.wrapper import EspeakWrapper
 from phonemizer.separator import Separator
 
 
@@ -50,36 +51,56 @@ class EspeakMbrolaBackend(BaseEspeakBackend):
     @classmethod
     def _all_supported_languages(cls):
         # retrieve the mbrola voices. This voices must be installed separately.
-        voices = EspeakWrapper().available_voices('mbrola')
+        voices = cls._probe().available_voices('mbrola')
         return {voice.identifier[3:]: voice.name for voice in voices}
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _installed_voices(data_path: Path) -> Set[str]:
+        """Returns the mbrola voices installed on the system
+
+        This is a reimplementation of LoadMbrolaTable from espeak
+        synth_mbrola.h sources. A voice is installed if one of the following
+        files exists: {data_path}/mbrola/{voice}, /usr/share/mbrola/{voice},
+        /usr/share/mbrola/{voice}/{voice} or /usr/share/mbrola/voices/{voice}.
+        The directories are scanned once instead of testing each file.
+
+        """
+        def scan(directory):
+            try:
+                with os.scandir(directory) as entries:
+                    return list(entries)
+            except OSError:
+                return []
+
+        voices = {
+            entry.name for entry in scan(pathlib.Path(data_path) / 'mbrola')
+            if entry.is_file()}
+
+        if sys.platform != 'win32':
+            for entry in scan('/usr/share/mbrola'):
+                if entry.is_file() or pathlib.Path(
+                        entry.path, entry.name).is_file():
+                    voices.add(entry.name)
+
+            voices.update(
+                entry.name for entry in scan('/usr/share/mbrola/voices')
+                if entry.is_file())
+
+        return voices
+
     @classmethod
     def _is_language_installed(cls, language: str, data_path: Union[str, Path]) \
             -> bool:
         """Returns True if the required mbrola voice is installed"""
-        # this is a reimplementation of LoadMbrolaTable from espeak
-        # synth_mbrola.h sources
         voice = language[3:]  # remove mb- prefix
-
-        if pathlib.Path(data_path / 'mbrola' / voice).is_file():
-            return True  # pragma: nocover
-
-        if sys.platform != 'win32':
-            candidates = [
-                f'/usr/share/mbrola/{voice}',
-                f'/usr/share/mbrola/{voice}/{voice}',
-                f'/usr/share/mbrola/voices/{voice}']
-            for candidate in candidates:
-                if pathlib.Path(candidate).is_file():
-                    return True
-
-        return False
+        return voice in cls._installed_voices(pathlib.Path(data_path))
 
     @classmethod
     def supported_languages(cls) -> Dict[str, str]:  # pragma: nocover
         """Returns the list of installed mbrola voices"""
         if cls._supported_languages is None:
-            data_path = EspeakWrapper().data_path
+            data_path = cls._probe().data_path
             cls._supported_languages = {
                 k: v for k, v in cls._all_supported_languages().items()
                 if cls._is_language_installed(k, data_path)}
@@ -87,22 +108,26 @@ class EspeakMbrolaBackend(BaseEspeakBackend):
 
     def _phonemize_aux(self, text: List[str], offset: int,
                        separator: Separator, strip: bool) -> List[str]:
-        output = []
-        for num, line in enumerate(text, start=1):
-            line = self._espeak.synthetize(line)
-            line = self._postprocess_line(line, offset + num, separator, strip)
-            output.append(line)
-        return output
+        # bind methods once out of the loop on utterances
+        synthetize = self._espeak.synthetize
+        postprocess_line = self._postprocess_line
+        return [
+            postprocess_line(synthetize(line), offset + num, separator, strip)
+            for num, line in enumerate(text, start=1)]
 
     def _postprocess_line(self, line: str, num: int,
                           separator: Separator, strip: bool) -> str:
         # retrieve the phonemes with the correct SAMPA alphabet (but
-        # without word separation)
-        phonemes = (
-            phn.split('\t')[0] for phn in line.split('\n') if phn.strip())
-        phonemes = separator.phone.join(pho for pho in phonemes if pho != '_')
+        # without word separation). Each line of espeak output is in the form
+        # "phoneme\tduration...", keep the phoneme only.
+        sep = separator.phone
+        phonemes = sep.join(
+            pho for pho in (
+                phn.partition('\t')[0]
+                for phn in line.split('\n') if phn.strip())
+            if pho != '_')
 
         if not strip:
-            phonemes += separator.phone
+            phonemes += sep
 
         return phonemes
@@ -21,6 +21,7 @@ import ctypes
 # the dataclasses module.
 class EspeakVoice:
     """A helper class to expose voice structures within C and Python"""
+    __slots__ = ('_name', '_language', '_identifier')
 
     def __init__(self, name: str = '', language: str = '', identifier: str = ''):
         self._name = name
@@ -43,13 +44,14 @@ class EspeakVoice:
         return self._identifier
 
     def __eq__(self, other: 'EspeakVoice'):
-        return (
-                self.name == other.name and
-                self.language == other.language and
-                self.identifier == other.identifier)
+        return self._key() == other._key()  # pylint: disable=protected-access
 
     def __hash__(self):
-        return hash((self.name, self.language, self.identifier))
+        return hash(self._key())
+
+    def _key(self):
+        """The (name, language, identifier) tuple identifying the voice"""
+        return self._name, self._language, self._identifier
 
     class VoiceStruct(ctypes.Structure):  # pylint: disable=too-few-public-methods
         """A helper class to fetch voices information from the espeak library.
@@ -74,8 +76,9 @@ class EspeakVoice:
     @classmethod
     def from_ctypes(cls, struct: VoiceStruct):
         """Returns a Voice instance built from an espeak ctypes structure"""
+        # do not fail on malformed voice data returned by espeak
         return cls(
-            name=(struct.name or b'').decode(),
+            name=(struct.name or b'').decode('utf8', 'replace'),
             # discard a useless char prepended by espeak
-            language=(struct.languages or b'0').decode()[1:],
-            identifier=(struct.identifier or b'').decode())
+            language=(struct.languages or b'0').decode('utf8', 'replace')[1:],
+            identifier=(struct.identifier or b'').decode('utf8', 'replace'))
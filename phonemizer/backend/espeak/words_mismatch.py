@@ -15,6 +15,9 @@
 """Manages words count mismatches for the espeak backend"""
 
 import abc
+import itertools
+import logging
+import operator
 import re
 from logging import Logger
 from typing import List, Tuple
@@ -66,17 +69,30 @@ class BaseWordsMismatch(abc.ABC):
             text: List[str],
             wordsep: Union[str, re.Pattern] = _RE_SPACES) -> List[int]:
         """Return the number of words contained in each line of `text`"""
-        if not isinstance(wordsep, re.Pattern):
-            wordsep = re.escape(wordsep)
+        if wordsep is cls._RE_SPACES:
+            # str.split() collapses runs of whitespace without regex overhead
+            return [len(line.split()) for line in text]
 
+        if isinstance(wordsep, re.Pattern):
+            return [
+                len([w for w in wordsep.split(line.strip()) if w])
+                for line in text]
+
+        if not wordsep:
+            # no word separator (empty or None): as with an empty regex
+            # split, each non-empty character is counted as a word
+            return [len(line.strip()) for line in text]
+
+        # a literal word separator, no need for a regex either
         return [
-            len([w for w in re.split(wordsep, line.strip()) if w])
+            len([w for w in line.strip().split(wordsep) if w])
             for line in text]
 
-    def _mismatched_lines(self) -> List[Tuple[int, int, int]]:
-        """Returns a list of (num_line, nwords_input, nwords_output)
+    def _has_mismatch(self) -> bool:
+        """Returns True if at least one line has a word count mismatch
 
-        Consider only the lines where nwords_input != nwords_output. Raises a
+        This is a fast path for the common case where all the lines match,
+        the lists comparison stops on the first difference. Raises a
         RuntimeError if input and output do not have the same number of lines.
 
         """
@@ -85,18 +101,52 @@ class BaseWordsMismatch(abc.ABC):
                 f'number of lines in input and output must be equal, '
                 f'we have: input={len(self._count_txt)}, '
                 f'output={len(self._count_phn)}')
+        return self._count_txt != self._count_phn
+
+    def _mismatched_lines(self) -> List[Tuple[int, int, int]]:
+        """Returns a list of (num_line, nwords_input, nwords_output)
+
+        Consider only the lines where nwords_input != nwords_output. Raises a
+        RuntimeError if input and output do not have the same number of lines.
 
+        """
+        if not self._has_mismatch():
+            return []
         return [
             (n, t, p) for n, (t, p) in
             enumerate(zip(self._count_txt, self._count_phn))
             if t != p]
 
+    def _mismatched_indices(self) -> List[int]:
+        """Returns the indices of the lines with a word count mismatch
+
+        Raises a RuntimeError if input and output do not have the same number
+        of lines.
+
+        """
+        if not self._has_mismatch():
+            return []
+        return list(itertools.compress(
+            itertools.count(),
+            map(operator.ne, self._count_txt, self._count_phn)))
+
+    def _count_mismatches(self) -> int:
+        """Returns the number of lines with a word count mismatch
+
+        Raises a RuntimeError if input and output do not have the same number
+        of lines.
+
+        """
+        if not self._has_mismatch():
+            return 0
+        return sum(map(operator.ne, self._count_txt, self._count_phn))
+
     def _resume(self, nmismatch: int, nlines: int):
         """Logs a high level undetailed warning"""
-        if nmismatch:
+        if nmismatch and self._logger.isEnabledFor(logging.WARNING):
             self._logger.warning(
-                'words count mismatch on %s%% of the lines (%s/%s)',
-                round(nmismatch / nlines, 2) * 100, nmismatch, nlines)
+                'words count mismatch on %.1f%% of the lines (%s/%s)',
+                100 * nmismatch / nlines, nmismatch, nlines)
 
     def count_text(self, text: List[str]):
         """Stores the number of words in each input line"""
@@ -120,7 +170,7 @@ class Ignore(BaseWordsMismatch):
     """Ignores word count mismatches"""
 
     def process(self, text: List[str]) -> List[str]:
-        self._resume(len(self._mismatched_lines()), len(text))
+        self._resume(self._count_mismatches(), len(text))
         return text
 
 
@@ -129,11 +179,14 @@ class Warn(BaseWordsMismatch):
 
     def process(self, text: List[str]) -> List[str]:
         mismatch = self._mismatched_lines()
-        for num, ntxt, nphn in mismatch:
-            self._logger.warning(
-                'words count mismatch on line %s '
-                '(expected %s words but get %s)',
-                num + 1, ntxt, nphn)
+
+        # do not iterate on the mismatched lines if warnings are not logged
+        if self._logger.isEnabledFor(logging.WARNING):
+            for num, ntxt, nphn in mismatch:
+                self._logger.warning(
+                    'words count mismatch on line %s '
+                    '(expected %s words but get %s)',
+                    num + 1, ntxt, nphn)
 
         self._resume(len(mismatch), len(text))
         return text
@@ -143,7 +196,7 @@ class Remove(BaseWordsMismatch):
     """Removes any utterance containing a word count mismatch"""
 
     def process(self, text: List[str]) -> List[str]:
-        mismatch = [line[0] for line in self._mismatched_lines()]
+        mismatch = self._mismatched_indices()
         self._resume(len(mismatch), len(text))
         self._logger.warning('removing the mismatched lines')
 
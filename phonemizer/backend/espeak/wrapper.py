@@ -16,13 +16,12 @@
 
 import ctypes
 import ctypes.util
-import functools
 import os
 import pathlib
 import sys
 import tempfile
 import weakref
-from typing import Tuple, Dict
+from typing import Dict, List, Optional, Tuple
 
 from phonemizer.backend.espeak.api import EspeakAPI
 from phonemizer.backend.espeak.voice import EspeakVoice
@@ -56,19 +55,41 @@ class EspeakWrapper:
         self._data_path = None
         self._voice = None
 
+        # the available voices, indexed by name, see available_voices(). This
+        # is cached per instance: a functools.lru_cache on the method would
+        # keep the wrapper alive and prevent its library copy to be recycled
+        self._available_voices: Dict[Optional[str], List[EspeakVoice]] = {}
+
         # load the espeak API
         self._espeak = EspeakAPI(self.library())
 
+        # a pointer to a pointer of chars, reused to send text to
+        # espeak_TextToPhonemes
+        self._text_buffer = ctypes.c_char_p()
+        self._text_ptr = ctypes.pointer(self._text_buffer)
+
+        # the phonemes modes sent to espeak_TextToPhonemes, indexed by tie, see
+        # _init_phonemes_modes()
+        self._phonemes_modes: Optional[Tuple[int, Optional[int]]] = None
+
         # lazy loading of attributes only required for the synthetize method
         self._libc_ = None
         self._tempfile_ = None
+        self._tempfile_args: Optional[Tuple[bytes, bytes]] = None
 
     @property
     def _libc(self):
         if self._libc_ is None:
-            self._libc_ = (
+            libc = (
                 ctypes.windll.msvcrt if sys.platform == 'win32' else
                 ctypes.cdll.LoadLibrary(ctypes.util.find_library('c')))
+
+            # init libc fopen and fclose functions
+            libc.fopen.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
+            libc.fopen.restype = ctypes.c_void_p
+            libc.fclose.argtypes = [ctypes.c_void_p]
+            libc.fclose.restype = ctypes.c_int
+            self._libc_ = libc
         return self._libc_
 
     @property
@@ -78,6 +99,10 @@ class EspeakWrapper:
             # pylint: disable=consider-using-with
             self._tempfile_ = tempfile.NamedTemporaryFile()
             weakref.finalize(self._tempfile_, self._tempfile_.close)
+
+            # the arguments of fopen, encoded once for all
+            self._tempfile_args = (
+                self._tempfile_.name.encode(), self._tempfile_.mode.encode())
         return self._tempfile_
 
     def __getstate__(self):
@@ -193,9 +218,14 @@ class EspeakWrapper:
         """
         return self._voice
 
-    @functools.lru_cache(maxsize=None)
     def available_voices(self, name=None):
         """Voices available for phonemization, as a list of `EspeakVoice`"""
+        try:
+            return self._available_voices[name]
+        except KeyError:
+            pass
+
+        key = name
         if name:
             name = EspeakVoice(language=name).to_ctypes()
         voices = self._espeak.list_voices(name or None)
@@ -210,6 +240,8 @@ class EspeakWrapper:
                 language=os.fsdecode(voice.languages)[1:],
                 identifier=os.fsdecode(voice.identifier)))
             index += 1
+
+        self._available_voices[key] = available_voices
         return available_voices
 
     def set_voice(self, voice_code):
@@ -265,6 +297,21 @@ class EspeakWrapper:
             return EspeakVoice.from_ctypes(voice)
         return None  # pragma: nocover
 
+    def _init_phonemes_modes(self) -> Tuple[int, Optional[int]]:
+        """Returns the espeak_TextToPhonemes modes without and with tie
+
+        The modes depend on the espeak version, they are computed once instead
+        of on each call to text_to_phonemes(). The tie mode is None for
+        espeak<=1.48.3 which does not support it.
+
+        """
+        # output phonemes in IPA and separated by _, or with a tie character if
+        # required. See comments for the function espeak_TextToPhonemes in
+        # speak_lib.h of the espeak sources for details.
+        if self.version <= (1, 48, 3):  # pragma: nocover
+            return 0x03 | 0x01 << 4, None
+        return ord('_') << 8 | 0x02, 0x02 | 0x01 << 7 | ord('͡') << 8
+
     def text_to_phonemes(self, text: str, tie: bool = False) -> str:
         """Translates a text into phonemes, must call set_voice() first.
 
@@ -289,33 +336,31 @@ class EspeakWrapper:
         if self.voice is None:  # pragma: nocover
             raise RuntimeError('no voice specified')
 
-        if tie and self.version <= (1, 48, 3):
+        if self._phonemes_modes is None:
+            self._phonemes_modes = self._init_phonemes_modes()
+        phonemes_mode = self._phonemes_modes[bool(tie)]
+
+        if phonemes_mode is None:
             raise RuntimeError(  # pragma: nocover
                 'tie option only compatible with espeak>=1.49')
 
-        # from Python string to C void** (a pointer to a pointer to chars)
-        text_ptr = ctypes.pointer(ctypes.c_char_p(text.encode('utf8')))
+        # from Python string to C void** (a pointer to a pointer to chars).
+        # espeak moves the pointer forward to the end of the text.
+        self._text_buffer.value = text.encode('utf8')
+        text_ptr = self._text_ptr
 
         # input text is encoded as UTF8
         text_mode = 1
 
-        # output phonemes in IPA and separated by _, or with a tie character if
-        # required. See comments for the function espeak_TextToPhonemes in
-        # speak_lib.h of the espeak sources for details.
-        if self.version <= (1, 48, 3):  # pragma: nocover
-            phonemes_mode = 0x03 | 0x01 << 4
-        elif tie:
-            phonemes_mode = 0x02 | 0x01 << 7 | ord('͡') << 8
-        else:
-            phonemes_mode = ord('_') << 8 | 0x02
-
+        # espeak returns phonemes clause by clause, the raw bytes are joined
+        # and decoded only once at the end
         result = []
         while text_ptr.contents.value is not None:
             phonemes = self._espeak.text_to_phonemes(
                 text_ptr, text_mode, phonemes_mode)
             if phonemes:
-                result.append(phonemes.decode())
-        return ' '.join(result)
+                result.append(phonemes)
+        return b' '.join(result).decode()
 
     def synthetize(self, text: str):
         """Translates a text into phonemes, must call set_voice() first.
@@ -339,21 +384,13 @@ class EspeakWrapper:
         if self.voice is None:  # pragma: nocover
             raise RuntimeError('no voice specified')
 
-        # init libc fopen and fclose functions
-        self._libc.fopen.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
-        self._libc.fopen.restype = ctypes.c_void_p
-        self._libc.fclose.argtypes = [ctypes.c_void_p]
-        self._libc.fclose.restype = ctypes.c_int
-
         # output phonemes in SAMPA and separated by _. Write the result to a
         # tempfile which is read back after phonemization (seems not possible
         # to redirect to stdout). See comments for the function
         # espeak_SetPhonemeTrace in speak_lib.h of the espeak sources for
         # details.
         self._tempfile.truncate(0)
-        file_p = self._libc.fopen(
-            self._tempfile.name.encode(),
-            self._tempfile.mode.encode())
+        file_p = self._libc.fopen(*self._tempfile_args)
 
         self._espeak.set_phoneme_trace(0x01 << 4 | ord('_') << 8, file_p)
         status = self._espeak.synthetize(
@@ -14,17 +14,17 @@
 # along with phonemizer. If not, see <http://www.gnu.org/licenses/>.
 """Festival backend for the phonemizer"""
 
+import collections
+import functools
 import os
 import pathlib
 import re
-import shlex
 import shutil
 import subprocess
-import sys
 import tempfile
 from logging import Logger
 from pathlib import Path
-from typing import Optional, Dict, List, IO, Union, Pattern
+from typing import Optional, Dict, List, IO, Tuple, Union, Pattern
 
 from phonemizer.backend.base import BaseBackend
 from phonemizer.backend.festival import lispy
@@ -39,6 +39,16 @@ class FestivalBackend(BaseBackend):
     # the method FestivalBackend.set_executable().
     _FESTIVAL_EXECUTABLE = None
 
+    # a translation table removing the characters reserved for scheme (the
+    # festival scripting language) from the input text
+    _FORBIDDEN_TABLE = str.maketrans('', '', '"()')
+
+    # runs of spaces in festival output, single spaces are left untouched
+    _SPACES_RE = re.compile(b'  +')
+
+    # extracts the version number from 'festival --version'
+    _VERSION_RE = re.compile(r'.* ([0-9\.]+[0-9]):')
+
     def __init__(self, language: str,
                  punctuation_marks: Optional[Union[str, Pattern]] = None,
                  preserve_punctuation: bool = False,
@@ -52,10 +62,34 @@ class FestivalBackend(BaseBackend):
         self.logger.debug('festival executable is %s', self.executable())
 
         # the Scheme script to be send to festival
+        self._script = self._load_script()
+
+        # LRU cache of raw festival outputs indexed by preprocessed utterance,
+        # see _process_cached()
+        self._cache_size = self._init_cache_size()
+        self._cache: 'collections.OrderedDict[str, str]' = (
+            collections.OrderedDict())
+
+    def __getstate__(self):
+        """For pickling, when phonemizing on multiple jobs"""
+        # the cache is not sent to the jobs
+        state = self.__dict__.copy()
+        state['_cache'] = collections.OrderedDict()
+        return state
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _load_script() -> Tuple[str, str]:
+        """Returns the Scheme script sent to festival
+
+        The script is read once and returned as a (prefix, suffix) pair, the
+        preprocessed text must be inserted in between.
+
+        """
         script_file = get_package_resource('festival/phonemize.scm')
         with open(script_file, 'r') as fscript:
-            self._script = fscript.read()
-        self.logger.debug('loaded %s', script_file)
+            prefix, suffix = fscript.read().split('{}')
+        return prefix, suffix
 
     @staticmethod
     def name():
@@ -149,18 +183,25 @@ class FestivalBackend(BaseBackend):
             version cannot be extracted for some reason.
 
         """
+        return cls._version(cls.executable())
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _version(cls, festival: Path) -> Tuple[int, ...]:
+        """Returns the version of the `festival` executable
 
-        festival = cls.executable()
+        The version is cached per executable to avoid running festival each
+        time a backend is instantiated.
 
+        """
         # the full version version string includes extra information
         # we don't need
         long_version = subprocess.check_output(
             [festival, '--version']).decode('latin1').strip()
 
         # extract the version number with a regular expression
-        festival_version_re = r'.* ([0-9\.]+[0-9]):'
         try:
-            version = re.match(festival_version_re, long_version).group(1)
+            version = cls._VERSION_RE.match(long_version).group(1)
         except AttributeError:
             raise RuntimeError(
                 f'cannot extract festival version from {festival}') from None
@@ -197,26 +238,24 @@ class FestivalBackend(BaseBackend):
         text = self._preprocess(text)
         if len(text) == 0:
             return []
-        text = self._process(text)
+        if self._cache_size:
+            text = self._process_cached(text)
+        else:
+            text = self._process(text)
         text = self._postprocess(text, separator, strip)
         return text
 
-    @staticmethod
-    def _double_quoted(line: str) -> str:
-        """Return the string `line` surrounded by double quotes"""
-        return '"' + line + '"'
-
-    @staticmethod
-    def _cleaned(line: str):
+    @classmethod
+    def _cleaned(cls, line: str):
         """Remove 'forbidden' characters from the line"""
         # special case (very unlikely but causes a crash in festival)
         # where a line is only made of '
-        if set(line) == set("'"):
-            line = ''
+        if line.count("'") == len(line):
+            return ''
 
         # remove forbidden characters (reserved for scheme, ie festival
         # scripting language)
-        return line.replace('"', '').replace('(', '').replace(')', '').strip()
+        return line.translate(cls._FORBIDDEN_TABLE).strip()
 
     @classmethod
     def _preprocess(cls, text: List[str]):
@@ -227,11 +266,10 @@ class FestivalBackend(BaseBackend):
         a multiline string. Empty lines in inputs are ignored.
 
         """
-        cleaned_text = (
-            cls._cleaned(line) for line in text if line != '')
-
-        return '\n'.join(
-            cls._double_quoted(line) for line in cleaned_text if line != '')
+        # clean and double quote each line in a single pass, the cleaned
+        # lines may be empty as well
+        return '\n'.join([
+            '"' + line + '"' for line in map(cls._cleaned, text) if line])
 
     def _process(self, text: str):
         """Return the raw phonemization of `text`
@@ -243,40 +281,72 @@ class FestivalBackend(BaseBackend):
         the text, as a scheme expression.
 
         """
-        with tempfile.NamedTemporaryFile('w+', delete=False) as data:
+        # the text is inlined in the Scheme script as a list of strings, so
+        # that a single file is sent to festival
+        with tempfile.NamedTemporaryFile('w+', delete=False) as scm:
             try:
-                # save the text as a tempfile
-                data.write(text)
-                data.close()
-
-                # fix the path name for windows
-                name = data.name
-                if sys.platform == 'win32':  # pragma: nocover
-                    name = name.replace('\\', '\\\\')
-
-                with tempfile.NamedTemporaryFile('w+', delete=False) as scm:
-                    try:
-                        scm.write(self._script.format(name))
-                        scm.close()
-
-                        cmd = f'{self.executable()} -b {scm.name}'
-                        if self.logger:
-                            self.logger.debug('running %s', cmd)
-
-                        # redirect stderr to a tempfile and displaying it only
-                        # on errors. Messages are something like: "UniSyn:
-                        # using default diphone ax-ax for y-pau". This is
-                        # related to wave synthesis (done by festival during
-                        # phonemization).
-                        with tempfile.TemporaryFile('w+') as fstderr:
-                            return self._run_festival(cmd, fstderr)
-                    finally:
-                        os.remove(scm.name)
+                scm.write(self._script[0] + text + self._script[1])
+                scm.close()
+
+                cmd = [str(self.executable()), '-b', scm.name]
+                if self.logger:
+                    self.logger.debug('running %s', ' '.join(cmd))
+
+                # redirect stderr to a tempfile and displaying it only on
+                # errors. Messages are something like: "UniSyn: using default
+                # diphone ax-ax for y-pau". This is related to wave synthesis
+                # (done by festival during phonemization).
+                with tempfile.TemporaryFile('w+') as fstderr:
+                    return self._run_festival(cmd, fstderr)
             finally:
-                os.remove(data.name)
+                os.remove(scm.name)
 
-    @staticmethod
-    def _run_festival(cmd: str, fstderr: IO) -> str:
+    def _process_cached(self, text: str) -> str:
+        """Return the raw phonemization of `text`, using the cache
+
+        Festival outputs one "SylStructure" tree per line of `text`, so only
+        the lines not yet in cache are sent to festival. Recent outputs are
+        cached so that repeated utterances are phonemized only once.
+
+        The festival outputs are aligned on the input lines by count only,
+        assuming the script prints exactly one non-empty tree per utterance.
+        If this does not hold, the whole `text` is phonemized again without
+        cache, which costs a second call to festival.
+
+        """
+        lines = text.split('\n')
+        cache = self._cache
+
+        trees = {}
+        for line in lines:
+            if line in cache:
+                trees[line] = cache[line]
+                cache.move_to_end(line)
+
+        missing = [line for line in dict.fromkeys(lines) if line not in trees]
+        if missing:
+            output = [
+                tree for tree in self._process('\n'.join(missing)).split('\n')
+                if tree != '']
+            if len(output) != len(missing):
+                # festival output cannot be aligned on input, bypass the cache
+                self.logger.debug(
+                    'festival output has %s trees for %s utterances, '
+                    'phonemizing again without cache',
+                    len(output), len(missing))
+                return self._process(text)
+
+            for line, tree in zip(missing, output):
+                trees[line] = tree
+                cache[line] = tree
+            while len(cache) > self._cache_size:
+                # drop the least recently used utterance
+                cache.popitem(last=False)
+
+        return '\n'.join(trees[line] for line in lines)
+
+    @classmethod
+    def _run_festival(cls, cmd: List[str], fstderr: IO) -> str:
         """Runs the festival command for phonemization
 
         Returns the raw phonemized output (need to be postprocesses). Raises a
@@ -284,47 +354,47 @@ class FestivalBackend(BaseBackend):
 
         """
         try:
-            output = subprocess.check_output(
-                shlex.split(cmd, posix=False), stderr=fstderr)
+            output = subprocess.check_output(cmd, stderr=fstderr)
 
-            # festival seems to use latin1 and not utf8
-            return re.sub(' +', ' ', output.decode('latin1'))
+            # festival seems to use latin1 and not utf8, as a single byte
+            # encoding spaces can be collapsed before decoding
+            return cls._SPACES_RE.sub(b' ', output).decode('latin1')
 
         except subprocess.CalledProcessError as err:  # pragma: nocover
             fstderr.seek(0)
+            cmd = ' '.join(cmd)
             raise RuntimeError(
                 f'Command "{cmd}" returned exit status {err.returncode}, '
                 f'output is:\n{fstderr.read()}') from None
 
     @staticmethod
-    def _postprocess_syll(syll: List[str], separator: Separator, strip: bool) -> str:
-        """Parse a syllable from festival to phonemized output"""
-        sep = separator.phone
-        out = (phone[0][0].replace('"', '') for phone in syll[1:])
-        out = sep.join(o for o in out if o != '')
-        return out if strip else out + sep
+    def _postprocess_line(line: str, separator: Separator, strip: bool) -> str:
+        """Parse a line from festival to phonemized output
 
-    @classmethod
-    def _postprocess_word(cls, word: List[List[str]], separator: Separator, strip: bool) -> str:
-        """Parse a word from festival to phonemized output"""
-        sep = separator.syllable
-        out = sep.join(
-            cls._postprocess_syll(syll, separator, strip)
-            for syll in word[1:])
-        return out if strip else out + sep
+        The line is a tree of words, syllables and phones, each level is joined
+        by its own separator. When `strip` is False each syllable, word and
+        line ends with a separator as well.
+
+        """
+        phone_sep = separator.phone
+        syll_sep = separator.syllable
+        word_sep = separator.word
+        phone_end = '' if strip else phone_sep
+        syll_end = '' if strip else syll_sep
+        word_end = '' if strip else word_sep
 
-    @classmethod
-    def _postprocess_line(cls, line: str, separator, strip: bool) -> str:
-        """Parse a line from festival to phonemized output"""
-        sep = separator.word
         out = []
         for word in lispy.parse(line):
-            word = cls._postprocess_word(word, separator, strip)
+            word = syll_sep.join(
+                phone_sep.join(
+                    phone for phone in (
+                        phone[0][0].replace('"', '') for phone in syll[1:])
+                    if phone != '') + phone_end
+                for syll in word[1:]) + syll_end
             if word != '':
                 out.append(word)
-        out = sep.join(out)
 
-        return out if strip else out + sep
+        return word_sep.join(out) + word_end
 
     @classmethod
     def _postprocess(cls, tree: str, separator: Separator, strip: bool) -> List[str]:
@@ -48,19 +48,33 @@ Expr = Union[str, List['Expr']]
 
 
 def _read_from_tokens(tokens: List[str]) -> Expr:
-    """Read an expression from a sequence of tokens"""
+    """Read an expression from a sequence of tokens
+
+    The nested lists are built iteratively with an explicit stack, in a single
+    pass over the tokens.
+
+    """
     if len(tokens) == 0:  # pragma: nocover
         raise SyntaxError('unexpected EOF while reading')
 
-    token = tokens.pop(0)
-    if token == '(':
-        expr = []
-        while tokens[0] != ')':
-            expr.append(_read_from_tokens(tokens))
-        tokens.pop(0)  # pop off ')'
-        return expr
-
+    token = tokens[0]
     if token == ')':  # pragma: nocover
         raise SyntaxError('unexpected )')
 
-    return token
+    if token != '(':
+        return token
+
+    # the expressions being read, from the outermost to the innermost
+    stack: List[List[Expr]] = []
+    for token in tokens:
+        if token == '(':
+            stack.append([])
+        elif token == ')':
+            expr = stack.pop()
+            if not stack:
+                return expr
+            stack[-1].append(expr)
+        else:
+            stack[-1].append(token)
+
+    raise IndexError('unbalanced parenthesis')
@@ -14,6 +14,7 @@
 # along with phonemizer. If not, see <http://www.gnu.org/licenses/>.
 """Segments backend for the phonemizer"""
 
+import functools
 import pathlib
 from logging import Logger
 from typing import Optional, Dict, List, Union, Pattern
@@ -32,6 +33,8 @@ class SegmentsBackend(BaseBackend):
     unknown morpheme.
 
     """
+    # this will be initialized once, at the first call to supported_languages()
+    _supported_languages = None
 
     def __init__(self, language: str,
                  punctuation_marks: Optional[Union[str, Pattern]] = None,
@@ -47,8 +50,7 @@ class SegmentsBackend(BaseBackend):
 
     def _init_language(self, language):
         # load the grapheme to phoneme mapping
-        profile = self._load_g2p_profile(language)
-        self._tokenizer = segments.Tokenizer(profile=profile)
+        self._tokenizer = self._load_tokenizer(language)
 
         # this is the language code
         return pathlib.Path(language).stem
@@ -65,8 +67,8 @@ class SegmentsBackend(BaseBackend):
     def is_available(cls):
         return True
 
-    @staticmethod
-    def supported_languages():
+    @classmethod
+    def supported_languages(cls):
         """Returns a dict of language: file supported by the segments backend
 
         The supported languages have a grapheme to phoneme conversion file
@@ -74,12 +76,15 @@ class SegmentsBackend(BaseBackend):
         parameter of the phonemize() function.
 
         """
-        # directory phonemizer/share/segments
-        directory = get_package_resource('segments')
+        if cls._supported_languages is None:
+            # directory phonemizer/share/segments
+            directory = get_package_resource('segments')
 
-        # supported languages are files with the 'g2p' extension
-        return {g2p.stem: g2p
+            # supported languages are files with the 'g2p' extension
+            cls._supported_languages = {
+                g2p.stem: g2p
                 for g2p in directory.iterdir() if g2p.suffix == '.g2p'}
+        return cls._supported_languages
 
     @classmethod
     def is_supported_language(cls, language: str) -> bool:
@@ -91,17 +96,46 @@ class SegmentsBackend(BaseBackend):
                 return False
         return language in cls.supported_languages()
 
+    @classmethod
+    def _g2p_file(cls, language: str) -> pathlib.Path:
+        """Returns the grapheme to phoneme file of a `language`
+
+        Raises a RuntimeError if the file is not found.
+
+        """
+        if pathlib.Path(language).is_file():
+            return pathlib.Path(language)
+
+        try:
+            return cls.supported_languages()[language]
+        except KeyError:
+            raise RuntimeError(
+                f'grapheme to phoneme file not found: '
+                f'{language}') from None
+
+    @classmethod
+    def _load_tokenizer(cls, language: str) -> segments.Tokenizer:
+        """Returns a segments tokenizer for a `language`
+
+        The tokenizers are cached by g2p file and modification time, so that
+        creating several backends for the same language builds a single
+        tokenizer.
+
+        """
+        g2p = cls._g2p_file(language)
+        return cls._cached_tokenizer(str(g2p), g2p.stat().st_mtime_ns)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _cached_tokenizer(cls, g2p: str, _mtime: int) -> segments.Tokenizer:
+        """Builds a segments tokenizer from a `g2p` file"""
+        return segments.Tokenizer(profile=cls._load_g2p_profile(g2p))
+
     @classmethod
     def _load_g2p_profile(cls, language: str) -> segments.Profile:
         """Returns a segments profile from a `language`"""
         # make sure the g2p file exists
-        if not pathlib.Path(language).is_file():
-            try:
-                language = cls.supported_languages()[language]
-            except KeyError:
-                raise RuntimeError(
-                    f'grapheme to phoneme file not found: '
-                    f'{language}') from None
+        language = cls._g2p_file(language)
 
         # load the mapping grapheme -> phoneme from the file, make sure all
         # lines are well formatted
@@ -121,23 +155,26 @@ class SegmentsBackend(BaseBackend):
 
     # pylint: disable=unused-argument
     def _phonemize_aux(self, text: List[str], offset: int, separator: Separator, strip: bool) -> List[str]:
-        # tokenize the input text per utterance
-        phonemized = (
-            self._tokenizer(line, column='mapping', errors='strict')
-            for line in text)
-
-        # the output of segments is always strip, so we need to add
-        # token separation at the end when strip is False.
-        if not strip:
-            # add word separator at end of utterance
-            phonemized = (p + ' # ' for p in phonemized)
-            # add phoneme separator at end of word
-            phonemized = (p.replace(' # ', '  # ') for p in phonemized)
-
-        # replace default separators by our custom ones
-        phonemized = (p.replace(' # ', '#') for p in phonemized)
-        phonemized = (p.replace(' ', separator.phone) for p in phonemized)
-        phonemized = (p.replace('#', separator.word) for p in phonemized)
-
-        # return the result as a list of utterances
-        return list(phonemized)
+        tokenizer = self._tokenizer
+        phone_sep = separator.phone
+        word_sep = separator.word
+
+        phonemized = []
+        for line in text:
+            # tokenize the input text per utterance
+            phn = tokenizer(line, column='mapping', errors='strict')
+
+            # the output of segments is always strip, so we need to add
+            # token separation at the end when strip is False: add word
+            # separator at end of utterance and phoneme separator at end of
+            # word
+            if not strip:
+                phn = (phn + ' # ').replace(' # ', '  # ')
+
+            # replace default separators by our custom ones
+            phonemized.append(
+                phn.replace(' # ', '#')
+                .replace(' ', phone_sep)
+                .replace('#', word_sep))
+
+        return phonemized
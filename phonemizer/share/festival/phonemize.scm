@@ -22,9 +22,10 @@ Extract the phonemes of the string LINE as a tree and write it to stdout."
   ;; Use of print instead of pprintf to have each utterance on one line
   (print (utt.relation_tree utterance "SylStructure")))
 
-;; This double braket have to be replaced by the name of the text file
-;; you want to read data from. To be parsed by festival as a unique
-;; utterance, each line of that file must begin and end with
-;; double-quotes.
-(set! lines (load "{}" t))
+;; This double braket have to be replaced by the text you want to
+;; phonemize. To be parsed by festival as a unique utterance, each line
+;; of that text must begin and end with double-quotes.
+(set! lines '(
+{}
+))
 (mapcar (lambda (line) (phonemize line)) lines)
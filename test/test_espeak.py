@@ -223,3 +223,61 @@ def test_tie_utf8():
 def test_tie_bad():
     with pytest.raises(RuntimeError):
         EspeakBackend('en-us', tie='abc')
+
+
+@pytest.mark.parametrize('line', [
+    'h_ə_l_ˈoʊ w_ˈɜː_l_d',
+    ' h_ə_l_ˈoʊ\nw_ˈɜː_l_d\n',
+    'h_ə_l_ˈoʊ   w_ˈɜː_l_d',
+    'h_ə_l_ˈoʊ \n\t w_ˈɜː_l_d '])
+def test_postprocess_spaces(line):
+    # pylint: disable=protected-access
+    # any run of whitespaces in espeak output is collapsed to a single word
+    # separator
+    backend = EspeakBackend('en-us')
+    assert backend._postprocess_line(
+        line, 0, default_separator, True) == ('həloʊ wɜːld', False)
+    assert backend._postprocess_line(
+        line, 0, Separator(phone='_', word=';'), False) == (
+            'h_ə_l_oʊ_;w_ɜː_l_d_;', False)
+
+
+def test_cache():
+    # pylint: disable=protected-access
+    backend = EspeakBackend('en-us')
+    text = ['hello world', 'goodbye', 'hello world']
+    out = backend.phonemize(text, default_separator, True)
+    assert out == ['həloʊ wɜːld', 'ɡʊdbaɪ', 'həloʊ wɜːld']
+    assert list(backend._cache.keys()) == ['goodbye', 'hello world']
+
+    # the cache stores raw espeak output, other separators are supported
+    out = backend.phonemize(['hello world'], Separator(phone='_'), True)
+    assert out == ['h_ə_l_oʊ w_ɜː_l_d']
+
+
+@pytest.mark.skipif(
+    'PHONEMIZER_CACHE_SIZE' in os.environ,
+    reason='cannot modify environment')
+@pytest.mark.parametrize('size', ['0', '1', '-1', 'foo'])
+def test_cache_size(size):
+    # pylint: disable=protected-access
+    try:
+        os.environ['PHONEMIZER_CACHE_SIZE'] = size
+        if size in ('-1', 'foo'):
+            with pytest.raises(RuntimeError) as err:
+                EspeakBackend('en-us')
+            assert 'must be a positive integer or 0' in str(err)
+            return
+
+        backend = EspeakBackend('en-us')
+        backend.phonemize(['hello', 'world'])
+        assert len(backend._cache) == int(size)
+    finally:
+        del os.environ['PHONEMIZER_CACHE_SIZE']
+
+
+def test_probe():
+    # pylint: disable=protected-access
+    # the class methods share a single wrapper on the espeak library
+    assert EspeakBackend._probe() is EspeakBackend._probe()
+    assert EspeakBackend.version() == EspeakBackend._probe().version
@@ -0,0 +1,134 @@
+# Copyright 2015-2021 Mathieu Bernard
+#
+# This file is part of phonemizer: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# Phonemizer is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with phonemizer. If not, see <http://www.gnu.org/licenses/>.
+"""Test of the espeak backend persistent cache"""
+
+# pylint: disable=missing-docstring
+# pylint: disable=redefined-outer-name
+
+import logging
+import os
+import pickle
+import sys
+
+import pytest
+
+from phonemizer.backend import EspeakBackend
+from phonemizer.backend.espeak.cache import DiskCache
+
+
+# library, data path, version, voice and tie
+KEY = (
+    '/usr/lib/libespeak-ng.so', '/usr/share/espeak-ng-data',
+    '1.51', 'gmw/en-US', '')
+
+
+def test_disk_cache(tmp_path):
+    cache = DiskCache(tmp_path / 'cache', *KEY)
+    assert cache.get('hello') is None
+
+    cache.set('hello', 'h_ə_l_ˈoʊ')
+    cache.flush()
+    assert cache.path.is_file()
+    assert cache.get('hello') == 'h_ə_l_ˈoʊ'
+
+    # the outputs are shared with new instances with the same configuration
+    assert DiskCache(
+        tmp_path / 'cache', *KEY).get('hello') == 'h_ə_l_ˈoʊ'
+
+    # but not with other libraries, data paths, versions, voices or ties
+    for index, value in enumerate((
+            '/opt/lib/libespeak-ng.so', '/opt/share/espeak-ng-data',
+            '1.50', 'roa/fr', '͡')):
+        key = KEY[:index] + (value,) + KEY[index + 1:]
+        assert DiskCache(tmp_path / 'cache', *key).get('hello') is None
+
+
+def test_disk_cache_pickle(tmp_path):
+    cache = DiskCache(tmp_path, *KEY)
+    cache.set('hello', 'h_ə_l_ˈoʊ')
+    cache.flush()
+
+    cache2 = pickle.loads(pickle.dumps(cache))
+    assert cache2.path == cache.path
+    assert cache2.get('hello') == 'h_ə_l_ˈoʊ'
+
+
+@pytest.mark.skipif(
+    sys.platform == 'win32' or os.geteuid() == 0,
+    reason='permissions are not enforced')
+def test_disk_cache_unwritable(tmp_path, caplog):
+    directory = tmp_path / 'cache'
+    directory.mkdir()
+    directory.chmod(0o500)
+    try:
+        cache = DiskCache(
+            directory, *KEY, logger=logging.getLogger())
+
+        # the database cannot be created, the cache is disabled with a
+        # warning and does not raise
+        with caplog.at_level(logging.WARNING):
+            assert cache.get('hello') is None
+        assert cache.disabled
+        assert 'disabling espeak cache' in caplog.text
+
+        cache.set('hello', 'h_ə_l_ˈoʊ')
+        cache.flush()
+        assert cache.get('hello') is None
+        assert not cache.path.exists()
+    finally:
+        directory.chmod(0o700)
+
+
+def test_disk_cache_not_a_directory(tmp_path, caplog):
+    # the cache directory cannot be created because a file exists
+    directory = tmp_path / 'cache'
+    directory.write_text('')
+    cache = DiskCache(
+        directory, *KEY, logger=logging.getLogger())
+
+    with caplog.at_level(logging.WARNING):
+        cache.set('hello', 'h_ə_l_ˈoʊ')
+        cache.flush()
+    assert cache.disabled
+    assert 'disabling espeak cache' in caplog.text
+    assert cache.get('hello') is None
+
+
+def test_disk_cache_close(tmp_path):
+    cache = DiskCache(tmp_path, *KEY)
+    cache.set('hello', 'h_ə_l_ˈoʊ')
+    cache.flush()
+    cache.close()
+
+    # the connection is opened again on demand
+    assert cache.get('hello') == 'h_ə_l_ˈoʊ'
+
+
+@pytest.mark.skipif(
+    'PHONEMIZER_CACHE_DIR' in os.environ,
+    reason='cannot modify environment')
+def test_backend(tmp_path):
+    # pylint: disable=protected-access
+    try:
+        os.environ['PHONEMIZER_CACHE_DIR'] = str(tmp_path)
+        backend = EspeakBackend('en-us')
+        assert backend.phonemize(['hello world']) == ['həloʊ wɜːld ']
+
+        # a new backend reads the output from the disk cache
+        backend = EspeakBackend('en-us')
+        assert backend._disk_cache.get('hello world') is not None
+        assert backend.phonemize(['hello world']) == ['həloʊ wɜːld ']
+    finally:
+        del os.environ['PHONEMIZER_CACHE_DIR']
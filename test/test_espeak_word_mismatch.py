@@ -3,10 +3,11 @@
 # pylint: disable=missing-docstring
 # pylint: disable=redefined-outer-name
 
-import pytest
-
+import logging
 import re
 
+import pytest
+
 from phonemizer import phonemize
 from phonemizer.backend.espeak.words_mismatch import Ignore
 from phonemizer.separator import Separator, default_separator
@@ -28,6 +29,50 @@ def test_count_words():
     assert count_words([' a  a \taa  ']) == [3]
 
 
+@pytest.mark.parametrize('word', ['', None])
+def test_count_words_no_separator(word):
+    # pylint: disable=protected-access
+    separator = Separator(phone=' ', word=word)
+    count_words = lambda phn: Ignore._count_words(phn, wordsep=separator.word)
+    assert count_words(['']) == [0]
+    assert count_words([' a b ']) == [3]
+    assert Ignore._count_words([' a b '], wordsep=word) == [3]
+
+
+def test_mismatched_lines():
+    # pylint: disable=protected-access
+    processor = Ignore(logging.getLogger())
+    processor._count_txt = [1, 2, 3, 4]
+    processor._count_phn = [1, 3, 3, 2]
+    assert processor._mismatched_lines() == [(1, 2, 3), (3, 4, 2)]
+    assert processor._mismatched_indices() == [1, 3]
+    assert processor._count_mismatches() == 2
+
+    processor._count_phn = [1, 2, 3, 4]
+    assert not processor._has_mismatch()
+    assert processor._mismatched_lines() == []
+    assert processor._mismatched_indices() == []
+    assert processor._count_mismatches() == 0
+
+
+@pytest.mark.parametrize('nmismatch, nlines, expected', [
+    (29, 100, '29.0%'), (2, 3, '66.7%'), (1, 1, '100.0%')])
+def test_resume(caplog, nmismatch, nlines, expected):
+    # pylint: disable=protected-access
+    Ignore(logging.getLogger())._resume(nmismatch, nlines)
+    assert caplog.messages == [
+        f'words count mismatch on {expected} of the lines '
+        f'({nmismatch}/{nlines})']
+
+
+def test_resume_disabled(caplog):
+    # pylint: disable=protected-access
+    logger = logging.getLogger('test_resume_disabled')
+    logger.setLevel(logging.ERROR)
+    Ignore(logger)._resume(2, 3)
+    assert not caplog.messages
+
+
 def test_bad():
     with pytest.raises(RuntimeError):
         phonemize('', words_mismatch='foo')
@@ -45,12 +90,12 @@ def test_mismatch(caplog, text, mode):
         assert phn == ['haʊ ɑːɹ juː ', 'aɪ hɐvbɪn bɪzi ', 'aɪ woʊntɐv taɪm ']
         messages = [msg[2] for msg in caplog.record_tuples]
         assert len(messages) == 1
-        assert 'words count mismatch on 67.0% of the lines (2/3)' in messages
+        assert 'words count mismatch on 66.7% of the lines (2/3)' in messages
     elif mode == 'remove':
         assert phn == ['haʊ ɑːɹ juː ', '', '']
         messages = [msg[2] for msg in caplog.record_tuples]
         assert len(messages) == 2
-        assert 'words count mismatch on 67.0% of the lines (2/3)' in messages
+        assert 'words count mismatch on 66.7% of the lines (2/3)' in messages
         assert 'removing the mismatched lines' in messages
     elif mode == 'warn':
         assert phn == ['haʊ ɑːɹ juː ', 'aɪ hɐvbɪn bɪzi ', 'aɪ woʊntɐv taɪm ']
@@ -62,7 +107,7 @@ def test_mismatch(caplog, text, mode):
         assert (
             'words count mismatch on line 3 (expected 4 words but get 3)'
             in messages)
-        assert 'words count mismatch on 67.0% of the lines (2/3)' in messages
+        assert 'words count mismatch on 66.7% of the lines (2/3)' in messages
 
 
 # from https://github.com/bootphon/phonemizer/issues/169
@@ -77,3 +122,12 @@ def test_custom_separator(caplog):
     assert phn == 't ɹ aɪ |'
     messages = [msg[2] for msg in caplog.record_tuples]
     assert len(messages) == 0
+
+
+@pytest.mark.parametrize('word', ['', None])
+def test_phonemize_no_word_separator(word):
+    # from docs/source/python_examples.rst
+    phn = phonemize(
+        ['hello'], backend='espeak', language='en-us', strip=True,
+        separator=Separator(phone=' ', word=word))
+    assert phn == ['h ə l oʊ']
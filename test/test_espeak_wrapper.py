@@ -21,6 +21,7 @@ import os
 import pathlib
 import pickle
 import sys
+import weakref
 
 import pytest
 
@@ -131,4 +132,64 @@ def test_deletion():
     wrapper = EspeakWrapper()
     path = pathlib.Path(wrapper._espeak._tempdir)
     del wrapper
+
+    # the library copy is released to the pool and recycled by the next
+    # wrapper
+    assert path.exists()
+    wrapper = EspeakWrapper()
+    assert pathlib.Path(wrapper._espeak._tempdir) == path
+    wrapper.set_voice('en-us')
+    assert 'oʊ' in wrapper.text_to_phonemes('hello')
+    del wrapper
+
+
+def test_available_voices_release():
+    # the cached voices do not keep the wrapper alive, so that its library
+    # copy can be released to the pool
+    wrapper = EspeakWrapper()
+    wrapper.set_voice('en-us')
+    assert wrapper.available_voices() is wrapper.available_voices()
+    ref = weakref.ref(wrapper)
+    del wrapper
+    assert ref() is None
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='not supported on Windows')
+def test_recycle_other_voice():
+    # pylint: disable=protected-access
+    wrapper = EspeakWrapper()
+    wrapper.set_voice('fr-fr')
+    assert 'ʁ' in wrapper.text_to_phonemes('bonjour')
+    path = pathlib.Path(wrapper._espeak._tempdir)
+    del wrapper
+
+    # the recycled copy is used with another voice
+    wrapper = EspeakWrapper()
+    assert pathlib.Path(wrapper._espeak._tempdir) == path
+    wrapper.set_voice('en-us')
+    assert wrapper.voice.language == 'en-us'
+    assert 'oʊ' in wrapper.text_to_phonemes('hello')
+    assert 'ʁ' not in wrapper.text_to_phonemes('bonjour')
+    del wrapper
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='not supported on Windows')
+@pytest.mark.skipif(
+    not EspeakMbrolaBackend.is_available() or
+    not EspeakMbrolaBackend.is_supported_language('mb-fr1'),
+    reason='mbrola or mb-fr1 voice not installed')
+def test_no_recycle_mbrola():
+    # pylint: disable=protected-access
+    wrapper = EspeakWrapper()
+    wrapper.set_voice('mb-fr1')
+    assert wrapper.synthetize('bonjour')
+    path = pathlib.Path(wrapper._espeak._tempdir)
+    del wrapper
+
+    # a copy used for mbrola is deleted, not recycled
     assert not path.exists()
+    wrapper = EspeakWrapper()
+    assert pathlib.Path(wrapper._espeak._tempdir) != path
+    wrapper.set_voice('en-us')
+    assert 'oʊ' in wrapper.text_to_phonemes('hello')
+    del wrapper
@@ -17,6 +17,8 @@
 # pylint: disable=missing-docstring
 
 
+import collections
+import logging
 import os
 import pathlib
 import shutil
@@ -55,6 +57,43 @@ def test_quote():
     assert _test(['it "s']) == ['ih-t eh-s']
 
 
+def test_cache():
+    # pylint: disable=protected-access
+    backend = FestivalBackend('en-us')
+    separator = Separator(word=' ', syllable='', phone='-')
+    assert backend._phonemize_aux(
+        ['it s', 'its', 'it s'], 0, separator, True) == [
+            'ih-t eh-s', 'ih-t-s', 'ih-t eh-s']
+    assert list(backend._cache) == ['"it s"', '"its"']
+
+    # the output is read from the cache
+    assert backend._phonemize_aux(['its'], 0, separator, True) == ['ih-t-s']
+    assert list(backend._cache) == ['"it s"', '"its"']
+
+
+def test_cache_mismatch(monkeypatch):
+    # pylint: disable=protected-access
+    # a backend without festival, only the cache is tested here
+    backend = FestivalBackend.__new__(FestivalBackend)
+    backend._logger = logging.getLogger()
+    backend._cache = collections.OrderedDict()
+    backend._cache_size = 10
+
+    calls = []
+
+    def process(text):
+        calls.append(text)
+        # one tree for two utterances: the output cannot be aligned
+        return '(tree)\n' if len(calls) == 1 else '(a)\n(b)\n'
+
+    monkeypatch.setattr(backend, '_process', process)
+
+    # the whole text is phonemized again, bypassing the cache
+    assert backend._process_cached('"a"\n"b"') == '(a)\n(b)\n'
+    assert calls == ['"a"\n"b"', '"a"\n"b"']
+    assert not backend._cache
+
+
 def test_im():
     sep = Separator(word=' ', syllable='', phone='')
     assert _test(["I'm looking for an image"], sep) \
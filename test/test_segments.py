@@ -111,3 +111,18 @@ def test_language(tmpdir):
     g2p = tmpdir.join('foo.g2p')
     g2p.write('\n'.join(['a a', 'b b b', 'c']))
     assert not SegmentsBackend.is_supported_language(g2p)
+
+
+def test_tokenizer_cache(tmpdir):
+    # pylint: disable=protected-access
+    assert (
+        SegmentsBackend('cree')._tokenizer is
+        SegmentsBackend('cree')._tokenizer)
+
+    # the tokenizer is rebuilt when the g2p file is modified
+    g2p = tmpdir.join('foo.g2p')
+    g2p.write('a b')
+    assert SegmentsBackend(str(g2p)).phonemize(['a']) == ['b ']
+    g2p.write('a c')
+    os.utime(str(g2p), ns=(0, 0))
+    assert SegmentsBackend(str(g2p)).phonemize(['a']) == ['c ']